@@ -109,7 +109,7 @@ def cmd_write_eval(args):
         DEFAULT_WRITE_MODELS,
         get_write_model,
         generate_write_report,
-        generate_write_json,
+        generate_write_outputs,
     )
     from .write_eval.test_cases import (
         ALL_WRITE_CASES,
@@ -166,35 +166,36 @@ def cmd_write_eval(args):
     print(f"Models: {valid_models}")
     print()
 
-    # Create runner
-    runner = WriteEvalRunner(
+    # Create runner and run evaluations
+    with WriteEvalRunner(
         models=valid_models,
         agent_cli_path=args.agent_cli,
         validator_path=args.validator,
         verbose=args.verbose,
-    )
-
-    # Run evaluations
-    results = runner.run_all(test_cases=test_cases)
+        cache_dir=args.cache_dir,
+    ) as runner:
+        results = runner.run_all(test_cases=test_cases)
 
     # Generate outputs
     if args.output:
         output_path = Path(args.output)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Generate report
+        # Generate report and JSON
         report_path = output_path / "write_report.md"
-        report = generate_write_report(results, str(report_path))
-        print(f"\nReport written to: {report_path}")
-
-        # Generate JSON
         json_path = output_path / "write_results.json"
-        generate_write_json(results, str(json_path))
+        generate_write_outputs(
+            results,
+            str(report_path),
+            str(json_path),
+            preview_chars=args.report_preview_chars,
+        )
+        print(f"\nReport written to: {report_path}")
         print(f"JSON results written to: {json_path}")
     else:
         # Print report to stdout
         print("\n" + "=" * 60)
-        report = generate_write_report(results)
+        report = generate_write_report(results, preview_chars=args.report_preview_chars)
         print(report)
 
 
@@ -337,6 +338,16 @@ def main():
         "--validator",
         help="Path to Worldview validator binary (optional)",
     )
+    write_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory to cache agent responses across runs (optional)",
+    )
+    write_parser.add_argument(
+        "--report-preview-chars",
+        type=int,
+        help="Cut generated content in the report to N characters (JSON keeps it in full)",
+    )
     write_parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -5,6 +5,9 @@ A minimal prompt that explains the Worldview format to the LLM being evaluated,
 focused on reading and reasoning with Worldview rather than maintaining it.
 """
 
+from functools import lru_cache
+
+
 WORLDVIEW_SYSTEM_PROMPT = """You have a worldview encoded in the Worldview format—a compact notation for beliefs and understanding.
 
 ## Reading Worldview Format
@@ -37,6 +40,21 @@ The Worldview document below encodes your current beliefs. When answering questi
 4. Follow references (`&`) to connect related concepts"""
 
 
+# Fixed text surrounding the embedded worldview in build_eval_prompt
+_PROMPT_PREFIX = f"""{WORLDVIEW_SYSTEM_PROMPT}
+
+## Your Worldview
+
+```wvf
+"""
+
+_PROMPT_SUFFIX = """
+```
+
+Answer based on your worldview. If your worldview conflicts with what you might otherwise believe, prioritize your worldview."""
+
+
+@lru_cache(maxsize=32)
 def build_eval_prompt(worldview_content: str) -> str:
     """
     Build complete system prompt for evaluation.
@@ -47,12 +65,4 @@ def build_eval_prompt(worldview_content: str) -> str:
     Returns:
         Complete system prompt with Worldview context
     """
-    return f"""{WORLDVIEW_SYSTEM_PROMPT}
-
-## Your Worldview
-
-```wvf
-{worldview_content}
-```
-
-Answer based on your worldview. If your worldview conflicts with what you might otherwise believe, prioritize your worldview."""
+    return _PROMPT_PREFIX + worldview_content + _PROMPT_SUFFIX
@@ -20,6 +20,7 @@ from .runner import (
     get_write_model,
     generate_write_report,
     generate_write_json,
+    generate_write_outputs,
 )
 from .test_cases import (
     Complexity,
@@ -48,6 +49,7 @@ __all__ = [
     "get_write_model",
     "generate_write_report",
     "generate_write_json",
+    "generate_write_outputs",
     # Test cases
     "Complexity",
     "TaskType",
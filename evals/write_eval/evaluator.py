@@ -89,6 +89,9 @@ class AgentMetrics:
     total_time_ms: int = 0
     thinking_time_ms: int = 0
 
+    # Replayed from the response cache rather than measured on this run
+    cached: bool = False
+
     # Agent interactions (captured from verbose output)
     thinking_content: list[str] = field(default_factory=list)
     tool_interactions: list[dict] = field(default_factory=list)
@@ -149,12 +152,13 @@ def parse_worldview_content(content: str) -> ParsedWorldview:
             claim_text = stripped[1:].strip()
             parsed.claims.append(claim_text)
 
-    # Extract operators from claims
+    # Extract operators from claims (in first-seen order)
+    seen_operators = set()
     for claim in parsed.claims:
         for op in WORLDVIEW_OPERATORS:
-            if op in claim:
-                if op not in parsed.operators_found:
-                    parsed.operators_found.append(op)
+            if op not in seen_operators and op in claim:
+                seen_operators.add(op)
+                parsed.operators_found.append(op)
 
     return parsed
 
@@ -315,9 +319,11 @@ def find_term(term: str, content: str) -> bool:
     - Word boundary aware
     - Handles hyphenated terms
     """
-    normalized_content = normalize_text(content)
-    normalized_term = normalize_text(term)
+    return _find_normalized_term(normalize_text(term), normalize_text(content))
+
 
+def _find_normalized_term(normalized_term: str, normalized_content: str) -> bool:
+    """Match an already-normalized term against already-normalized content."""
     # Direct match
     if normalized_term in normalized_content:
         return True
@@ -477,16 +483,17 @@ def evaluate_write(
     else:
         score.operator_score = 1.0
 
-    # Check required terms (in full content)
+    # Check required terms (in full content, normalized once)
+    normalized_content = normalize_text(generated_content)
     for term in expected.required_terms:
-        if find_term(term, generated_content):
+        if _find_normalized_term(normalize_text(term), normalized_content):
             score.terms_found.append(term)
         else:
             score.terms_missing.append(term)
 
     # Check forbidden terms
     for term in expected.forbidden_terms:
-        if find_term(term, generated_content):
+        if _find_normalized_term(normalize_text(term), normalized_content):
             score.forbidden_terms_found.append(term)
 
     if expected.required_terms:
@@ -558,7 +565,7 @@ class WriteSummary:
     # Efficiency metrics
     avg_tool_calls: float = 0.0
     avg_tokens: float = 0.0
-    avg_time_ms: float = 0.0
+    avg_time_ms: Optional[float] = None  # None when no timings were measured
 
     @property
     def success_rate(self) -> float:
@@ -638,7 +645,9 @@ def summarize_write_results(results: list[WriteResult]) -> WriteSummary:
         tool_calls.append(result.metrics.tool_calls)
         total_tokens = result.metrics.input_tokens + result.metrics.output_tokens
         tokens.append(total_tokens)
-        times.append(result.metrics.total_time_ms)
+        # Cached responses replay old timings; keep them out of the average
+        if not result.metrics.cached:
+            times.append(result.metrics.total_time_ms)
 
     # Compute averages
     if syntax_scores:
@@ -5,15 +5,21 @@ Orchestrates running write test cases against the Worldview agent CLI
 with different models, capturing metrics and verbose output.
 """
 
+import hashlib
 import json
+import os
 import re
+import shlex
+import shutil
 import subprocess
 import tempfile
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence
 
 from .test_cases import (
     ALL_WRITE_CASES,
@@ -33,7 +39,7 @@ from .evaluator import (
 
 
 # Models available for write evaluation (must support Anthropic API with extended thinking)
-WRITE_MODELS = [
+_WRITE_MODEL_CONFIGS = [
     {
         "name": "claude-sonnet",
         "model_id": "claude-sonnet-4-20250514",
@@ -51,15 +57,18 @@ WRITE_MODELS = [
     },
 ]
 
+# Read-only views, so callers cannot mutate the shared configs
+WRITE_MODELS = [MappingProxyType(model) for model in _WRITE_MODEL_CONFIGS]
+
+# Model lookup by name
+_WRITE_MODELS_BY_NAME = {m["name"]: m for m in WRITE_MODELS}
+
 DEFAULT_WRITE_MODELS = ["claude-sonnet", "claude-haiku"]
 
 
-def get_write_model(name: str) -> Optional[dict]:
+def get_write_model(name: str) -> Optional[Mapping[str, str]]:
     """Get model config by name."""
-    for model in WRITE_MODELS:
-        if model["name"] == name:
-            return model
-    return None
+    return _WRITE_MODELS_BY_NAME.get(name)
 
 
 class WriteEvalRunner:
@@ -76,6 +85,9 @@ class WriteEvalRunner:
         agent_cli_path: str = "worldview",
         validator_path: Optional[str] = None,
         verbose: bool = False,
+        cache_dir: Optional[Path] = None,
+        cache_ttl: Optional[float] = None,
+        store_transcripts: Optional[bool] = None,
     ):
         """
         Initialize the write evaluation runner.
@@ -85,6 +97,10 @@ class WriteEvalRunner:
             agent_cli_path: Path to Worldview agent CLI
             validator_path: Path to validator binary (optional)
             verbose: Print detailed output during evaluation
+            cache_dir: Directory for cached agent responses (optional)
+            cache_ttl: Maximum age of a cached response in seconds (optional)
+            store_transcripts: Keep agent thinking and tool interactions
+                in metrics (default: same as verbose)
         """
         self.model_names = models or DEFAULT_WRITE_MODELS
         self.models = []
@@ -98,6 +114,92 @@ class WriteEvalRunner:
         self.agent_cli_path = agent_cli_path
         self.validator_path = validator_path
         self.verbose = verbose
+        self.store_transcripts = verbose if store_transcripts is None else store_transcripts
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
+        self._agent_fingerprint = ""
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._agent_fingerprint = self._fingerprint_agent()
+        self._eval_pool: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self) -> "WriteEvalRunner":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Shut down the background evaluation pool."""
+        if self._eval_pool is not None:
+            self._eval_pool.shutdown()
+            self._eval_pool = None
+
+    def _get_eval_pool(self) -> ThreadPoolExecutor:
+        """
+        Get or create the background scorer.
+
+        Scoring mostly waits on the validator subprocess, and only one
+        result is scored ahead of the agent at a time, so a single worker
+        thread is enough.
+        """
+        if self._eval_pool is None:
+            self._eval_pool = ThreadPoolExecutor(max_workers=1)
+        return self._eval_pool
+
+    def _fingerprint_agent(self) -> str:
+        """Identify the agent binary so a rebuilt or different CLI misses the cache."""
+        agent_path = shutil.which(self.agent_cli_path) or self.agent_cli_path
+        try:
+            stat = os.stat(agent_path)
+        except OSError:
+            return agent_path
+        return f"{os.path.realpath(agent_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+
+    def _cache_path(
+        self,
+        fact_statement: str,
+        base_content: str,
+        model_id: str,
+    ) -> Optional[Path]:
+        """Get the cache file for an agent call, keyed by its inputs."""
+        if not self.cache_dir:
+            return None
+        key = hashlib.sha256(b"\x00".join([
+            fact_statement.encode(),
+            base_content.encode(),
+            model_id.encode(),
+            self._agent_fingerprint.encode(),
+            # Entries from runs without transcripts lack thinking and tool calls
+            b"transcripts" if self.store_transcripts else b"",
+        ])).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _load_cached(self, cache_file: Path) -> Optional[tuple[str, AgentMetrics]]:
+        """Load a cached agent response, ignoring missing or expired entries."""
+        try:
+            if self.cache_ttl is not None:
+                age = time.time() - cache_file.stat().st_mtime
+                if age > self.cache_ttl:
+                    return None
+            cached = json.loads(cache_file.read_text())
+            return cached["content"], AgentMetrics(**cached["metrics"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store_cached(self, cache_file: Path, content: str, metrics: AgentMetrics):
+        """Write an agent response to the cache atomically, skipping it on failure."""
+        tmp_file = cache_file.with_suffix(".json.tmp")
+        try:
+            tmp_file.write_text(json.dumps({"content": content, "metrics": asdict(metrics)}))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+            if self.verbose:
+                print(f"    Cache write failed: {e}")
 
     def _run_agent(
         self,
@@ -116,6 +218,16 @@ class WriteEvalRunner:
         Returns:
             Tuple of (generated_content, metrics, error_message)
         """
+        cache_file = self._cache_path(fact_statement, base_content, model_id)
+        if cache_file:
+            cached = self._load_cached(cache_file)
+            if cached:
+                if self.verbose:
+                    print(f"    Cache hit: {cache_file.name}")
+                generated_content, metrics = cached
+                metrics.cached = True
+                return generated_content, metrics, None
+
         metrics = AgentMetrics()
 
         # Create temporary file with base content
@@ -137,7 +249,7 @@ class WriteEvalRunner:
             ]
 
             if self.verbose:
-                print(f"    Running: {' '.join(cmd[:3])}...")
+                print("    Running:", shlex.join(cmd[:3]), "...")
 
             # Run with timing
             start_time = time.time()
@@ -163,6 +275,9 @@ class WriteEvalRunner:
             with open(temp_path) as f:
                 generated_content = f.read()
 
+            if cache_file:
+                self._store_cached(cache_file, generated_content, metrics)
+
             return generated_content, metrics, None
 
         except subprocess.TimeoutExpired:
@@ -188,10 +303,14 @@ class WriteEvalRunner:
         [done] Input: X, Output: Y, Thinking: Z
         [timing] Total: Xms, Tool calls: N
 
+        Thinking content and tool interactions are only retained when
+        store_transcripts is enabled; counters are always populated.
+
         Args:
             stderr: The stderr output from the agent
             metrics: AgentMetrics to populate
         """
+        store = self.store_transcripts
         current_thinking = []
         current_tool_name = None
 
@@ -223,19 +342,21 @@ class WriteEvalRunner:
 
                 # Store thinking before this tool call
                 if current_thinking:
-                    metrics.thinking_content.extend(current_thinking)
+                    if store:
+                        metrics.thinking_content.extend(current_thinking)
                     current_thinking = []
 
                 # Store tool interaction
-                metrics.tool_interactions.append({
-                    "type": "tool_call",
-                    "name": tool_content,
-                })
+                if store:
+                    metrics.tool_interactions.append({
+                        "type": "tool_call",
+                        "name": tool_content,
+                    })
 
             # Tool parameters
             elif line.startswith("[params]"):
-                params_content = line[len("[params]"):].strip()
-                if metrics.tool_interactions:
+                if store and metrics.tool_interactions:
+                    params_content = line[len("[params]"):].strip()
                     metrics.tool_interactions[-1]["params"] = params_content
 
             # Tool results with timing: [result:Xms] ...
@@ -246,10 +367,11 @@ class WriteEvalRunner:
                 if "failed" in result_content.lower() or "error" in result_content.lower():
                     metrics.failed_edits += 1
 
-                metrics.tool_interactions.append({
-                    "type": "tool_result",
-                    "content": result_content,
-                })
+                if store:
+                    metrics.tool_interactions.append({
+                        "type": "tool_result",
+                        "content": result_content,
+                    })
 
             # Completion with token usage
             elif line.startswith("[done]"):
@@ -275,37 +397,42 @@ class WriteEvalRunner:
 
             # Retry attempts
             elif line.startswith("[retry]"):
-                metrics.tool_interactions.append({
-                    "type": "retry",
-                    "content": line[len("[retry]"):].strip(),
-                })
+                if store:
+                    metrics.tool_interactions.append({
+                        "type": "retry",
+                        "content": line[len("[retry]"):].strip(),
+                    })
 
             # Error with timing
             elif line.startswith("[error"):
-                error_content = line.split("]", 1)[-1].strip()
-                metrics.tool_interactions.append({
-                    "type": "error",
-                    "content": error_content,
-                })
+                if store:
+                    error_content = line.split("]", 1)[-1].strip()
+                    metrics.tool_interactions.append({
+                        "type": "error",
+                        "content": error_content,
+                    })
 
         # Store any remaining thinking content
-        if current_thinking:
+        if current_thinking and store:
             metrics.thinking_content.extend(current_thinking)
 
-    def _run_single_eval(
+    def _start_single_eval(
         self,
         test_case: WriteTestCase,
-        model: dict,
-    ) -> WriteResult:
+        model: Mapping[str, str],
+    ) -> tuple[str, AgentMetrics, Optional[str], Optional[Future]]:
         """
-        Run a single write evaluation.
+        Run the agent for a single write evaluation and submit scoring.
+
+        Scoring runs in the evaluation pool so it can overlap with the
+        next agent call.
 
         Args:
             test_case: The test case to run
             model: The model configuration
 
         Returns:
-            WriteResult with generated content and scoring
+            Tuple of (generated_content, metrics, error_message, score_future)
         """
         if self.verbose:
             print(f"  Running: {test_case.id} with {model['display_name']}")
@@ -317,6 +444,37 @@ class WriteEvalRunner:
             model["model_id"],
         )
 
+        if error:
+            return generated_content, metrics, error, None
+
+        # Evaluate the generated content in the background
+        score_future = self._get_eval_pool().submit(
+            evaluate_write,
+            generated_content,
+            test_case,
+            self.validator_path,
+        )
+        return generated_content, metrics, None, score_future
+
+    def _finish_single_eval(
+        self,
+        test_case: WriteTestCase,
+        model: Mapping[str, str],
+        pending: tuple[str, AgentMetrics, Optional[str], Optional[Future]],
+    ) -> WriteResult:
+        """
+        Wait for scoring of a started evaluation and build its result.
+
+        Args:
+            test_case: The test case that was run
+            model: The model configuration
+            pending: Value returned by _start_single_eval
+
+        Returns:
+            WriteResult with generated content and scoring
+        """
+        generated_content, metrics, error, score_future = pending
+
         if error:
             return WriteResult(
                 test_case=test_case,
@@ -327,12 +485,7 @@ class WriteEvalRunner:
                 error=error,
             )
 
-        # Evaluate the generated content
-        score = evaluate_write(
-            generated_content,
-            test_case,
-            validator_path=self.validator_path,
-        )
+        score = score_future.result()
 
         return WriteResult(
             test_case=test_case,
@@ -342,10 +495,28 @@ class WriteEvalRunner:
             metrics=metrics,
         )
 
+    def _run_single_eval(
+        self,
+        test_case: WriteTestCase,
+        model: Mapping[str, str],
+    ) -> WriteResult:
+        """
+        Run a single write evaluation.
+
+        Args:
+            test_case: The test case to run
+            model: The model configuration
+
+        Returns:
+            WriteResult with generated content and scoring
+        """
+        pending = self._start_single_eval(test_case, model)
+        return self._finish_single_eval(test_case, model, pending)
+
     def run_case(
         self,
         test_case: WriteTestCase,
-        models: Optional[list[dict]] = None,
+        models: Optional[list[Mapping[str, str]]] = None,
     ) -> list[WriteResult]:
         """
         Run a single test case against specified models.
@@ -374,12 +545,15 @@ class WriteEvalRunner:
 
     def run_all(
         self,
-        test_cases: Optional[list[WriteTestCase]] = None,
-        models: Optional[list[dict]] = None,
+        test_cases: Optional[Sequence[WriteTestCase]] = None,
+        models: Optional[list[Mapping[str, str]]] = None,
     ) -> dict[str, list[WriteResult]]:
         """
         Run all test cases against all models.
 
+        Agent calls run sequentially; each result is scored in the
+        background while the next agent call runs, then collected.
+
         Args:
             test_cases: Cases to run (default: ALL_WRITE_CASES)
             models: Models to test (default: self.models)
@@ -396,6 +570,7 @@ class WriteEvalRunner:
 
         total = len(test_cases) * len(models)
         current = 0
+        previous = None
 
         for test_case in test_cases:
             if self.verbose:
@@ -406,19 +581,35 @@ class WriteEvalRunner:
                 if self.verbose:
                     print(f"  [{current}/{total}] {model['display_name']}...")
 
-                result = self._run_single_eval(test_case, model)
-                results_by_model[model["display_name"]].append(result)
+                pending = self._start_single_eval(test_case, model)
+                if previous:
+                    self._collect_eval(previous, results_by_model)
+                previous = (test_case, model, pending)
 
-                if self.verbose:
-                    status = "PASS" if result.success else ("ERROR" if result.error else "FAIL")
-                    print(f"    [{status}] Score: {result.score.overall_score:.2f}")
+        if previous:
+            self._collect_eval(previous, results_by_model)
 
         return results_by_model
 
+    def _collect_eval(
+        self,
+        started: tuple[WriteTestCase, Mapping[str, str], tuple],
+        results_by_model: dict[str, list[WriteResult]],
+    ):
+        """Finish a started evaluation and record its result."""
+        test_case, model, pending = started
+        result = self._finish_single_eval(test_case, model, pending)
+        results_by_model[model["display_name"]].append(result)
+
+        if self.verbose:
+            status = "PASS" if result.success else ("ERROR" if result.error else "FAIL")
+            print(f"    [{status}] {test_case.id} / {model['display_name']} "
+                  f"Score: {result.score.overall_score:.2f}")
+
     def run_complexity(
         self,
         complexity: Complexity,
-        models: Optional[list[dict]] = None,
+        models: Optional[list[Mapping[str, str]]] = None,
     ) -> dict[str, list[WriteResult]]:
         """
         Run all test cases of a specific complexity.
@@ -434,9 +625,15 @@ class WriteEvalRunner:
         return self.run_all(test_cases=cases, models=models)
 
 
+# Per-model row of the "Results by Model" table in the write report
+_RESULT_ROW_TEMPLATE = "| %s | %s | %s | %s | %s | %.2f | %dms%s | %d |"
+
+
 def generate_write_report(
     results_by_model: dict[str, list[WriteResult]],
     output_path: Optional[str] = None,
+    timestamp: Optional[str] = None,
+    preview_chars: Optional[int] = None,
 ) -> str:
     """
     Generate a markdown report from write evaluation results.
@@ -444,16 +641,20 @@ def generate_write_report(
     Args:
         results_by_model: Results organized by model name
         output_path: Optional path to write report
+        timestamp: Generation timestamp (default: current UTC time)
+        preview_chars: Cut generated content in the report to this many
+            characters (default: show it in full)
 
     Returns:
         Markdown report string
     """
+    timestamp = timestamp or datetime.now(timezone.utc).isoformat()
     lines = [
         "# Write Evaluation Report",
         "",
         "Benchmarks embedding models on Worldview document generation and updates.",
         "",
-        f"Generated: {datetime.now().isoformat()}",
+        f"Generated: {timestamp}",
         "",
         "## Summary by Model",
         "",
@@ -466,6 +667,7 @@ def generate_write_report(
     for model_name, results in results_by_model.items():
         summary = summarize_write_results(results)
         model_summaries[model_name] = summary
+        avg_time = "n/a" if summary.avg_time_ms is None else f"{summary.avg_time_ms:.0f}ms"
 
         lines.append(
             f"| {model_name} | "
@@ -474,10 +676,19 @@ def generate_write_report(
             f"{summary.moderate_rate:.1%} | "
             f"{summary.complex_rate:.1%} | "
             f"{summary.avg_overall_score:.2f} | "
-            f"{summary.avg_time_ms:.0f}ms | "
+            f"{avg_time} | "
             f"{summary.avg_tool_calls:.1f} |"
         )
 
+    cached_count = sum(
+        r.metrics.cached for results in results_by_model.values() for r in results
+    )
+    if cached_count:
+        lines.extend([
+            "",
+            f"Avg Time excludes {cached_count} responses replayed from the cache.",
+        ])
+
     lines.extend([
         "",
         "## Efficiency Comparison",
@@ -550,12 +761,17 @@ def generate_write_report(
                 syntax = "OK" if result.score.syntax_valid else "FAIL"
                 concepts = f"{len(result.score.concepts_found)}/{len(tc.expected.required_concepts)}"
                 terms = f"{len(result.score.terms_found)}/{len(tc.expected.required_terms)}"
-                lines.append(
-                    f"| {model_name} | {passed} | {syntax} | {concepts} | {terms} | "
-                    f"{result.score.overall_score:.2f} | "
-                    f"{result.metrics.total_time_ms}ms | "
-                    f"{result.metrics.tool_calls} |"
-                )
+                lines.append(_RESULT_ROW_TEMPLATE % (
+                    model_name,
+                    passed,
+                    syntax,
+                    concepts,
+                    terms,
+                    result.score.overall_score,
+                    result.metrics.total_time_ms,
+                    " (cached)" if result.metrics.cached else "",
+                    result.metrics.tool_calls,
+                ))
 
         # Add generated content samples
         lines.extend([
@@ -570,7 +786,10 @@ def generate_write_report(
             if result.error:
                 lines.append(f"```\nERROR: {result.error}\n```")
             elif result.generated_content:
-                lines.append(f"```wvf\n{result.generated_content}\n```")
+                content = result.generated_content
+                if preview_chars is not None and len(content) > preview_chars:
+                    content = content[:preview_chars] + "\n..."
+                lines.append(f"```wvf\n{content}\n```")
             else:
                 lines.append("```\n(no content generated)\n```")
 
@@ -610,6 +829,7 @@ def generate_write_report(
 def generate_write_json(
     results_by_model: dict[str, list[WriteResult]],
     output_path: Optional[str] = None,
+    timestamp: Optional[str] = None,
 ) -> dict:
     """
     Generate JSON results for programmatic analysis.
@@ -617,12 +837,13 @@ def generate_write_json(
     Args:
         results_by_model: Results organized by model name
         output_path: Optional path to write JSON
+        timestamp: Generation timestamp (default: current UTC time)
 
     Returns:
         Dict with complete results data
     """
     data = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
         "eval_type": "write",
         "models": {},
     }
@@ -665,6 +886,7 @@ def generate_write_json(
                         "input_tokens": r.metrics.input_tokens,
                         "output_tokens": r.metrics.output_tokens,
                         "thinking_tokens": r.metrics.thinking_tokens,
+                        "cached": r.metrics.cached,
                     },
                     "generated_content": r.generated_content,
                     "agent_thinking": r.metrics.thinking_content,
@@ -675,6 +897,37 @@ def generate_write_json(
         }
 
     if output_path:
-        Path(output_path).write_text(json.dumps(data, indent=2))
+        with open(output_path, "w", buffering=1 << 16) as f:
+            json.dump(data, f, indent=2)
 
     return data
+
+
+def generate_write_outputs(
+    results_by_model: dict[str, list[WriteResult]],
+    report_path: Optional[str] = None,
+    json_path: Optional[str] = None,
+    preview_chars: Optional[int] = None,
+) -> tuple[str, dict]:
+    """
+    Generate the markdown report and JSON results with a shared timestamp.
+
+    The JSON always carries the full generated content; preview_chars only
+    shortens what the markdown report shows.
+
+    Args:
+        results_by_model: Results organized by model name
+        report_path: Optional path to write report
+        json_path: Optional path to write JSON
+        preview_chars: Cut generated content in the report to this many
+            characters (default: show it in full)
+
+    Returns:
+        Tuple of (markdown report, JSON results data)
+    """
+    timestamp = datetime.now(timezone.utc).isoformat()
+    report = generate_write_report(
+        results_by_model, report_path, timestamp=timestamp, preview_chars=preview_chars
+    )
+    data = generate_write_json(results_by_model, json_path, timestamp=timestamp)
+    return report, data
@@ -15,6 +15,21 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
+__all__ = [
+    "Complexity",
+    "TaskType",
+    "ExpectedStructure",
+    "WriteTestCase",
+    "SIMPLE_CASES",
+    "MODERATE_CASES",
+    "COMPLEX_CASES",
+    "REJECTION_CASES",
+    "ALL_WRITE_CASES",
+    "get_cases_by_complexity",
+    "get_cases_by_task_type",
+    "get_case_by_id",
+]
+
 
 class Complexity(Enum):
     """
@@ -39,7 +54,7 @@ class TaskType(Enum):
     REJECT = "reject"  # Should refuse to modify file (ephemeral events, etc.)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExpectedStructure:
     """Expected structural elements in the generated Worldview content."""
 
@@ -65,7 +80,7 @@ class ExpectedStructure:
     requires_valid_syntax: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WriteTestCase:
     """
     A single write evaluation test case.
@@ -97,7 +112,7 @@ class WriteTestCase:
 # Single concept, straightforward formatting
 # =============================================================================
 
-SIMPLE_CASES = [
+SIMPLE_CASES = (
     WriteTestCase(
         id="simple-gravity",
         name="Basic physics fact",
@@ -157,14 +172,14 @@ SIMPLE_CASES = [
         ),
         notes="Add new concept to existing file",
     ),
-]
+)
 
 # =============================================================================
 # MODERATE TEST CASES
 # Multiple facets, operators, conditions
 # =============================================================================
 
-MODERATE_CASES = [
+MODERATE_CASES = (
     WriteTestCase(
         id="moderate-causation",
         name="Causal relationship with operator",
@@ -261,14 +276,14 @@ MODERATE_CASES = [
         ),
         notes="Tests source attribution notation",
     ),
-]
+)
 
 # =============================================================================
 # COMPLEX TEST CASES
 # Multiple concepts, cross-references, nuanced notation
 # =============================================================================
 
-COMPLEX_CASES = [
+COMPLEX_CASES = (
     WriteTestCase(
         id="complex-multi-concept",
         name="Multiple interrelated concepts",
@@ -380,14 +395,14 @@ COMPLEX_CASES = [
         ),
         notes="Tests comprehensive notation usage",
     ),
-]
+)
 
 # =============================================================================
 # REJECTION/FILTER TEST CASES
 # Tests for ephemeral events that should be rejected or filtered
 # =============================================================================
 
-REJECTION_CASES = [
+REJECTION_CASES = (
     WriteTestCase(
         id="accept-dev-preference",
         name="Development tooling preference",
@@ -442,7 +457,7 @@ REJECTION_CASES = [
             "a durable belief. Agent should extract only the belief about sleep."
         ),
     ),
-]
+)
 
 # =============================================================================
 # ALL TEST CASES
@@ -451,19 +466,26 @@ REJECTION_CASES = [
 ALL_WRITE_CASES = SIMPLE_CASES + MODERATE_CASES + COMPLEX_CASES + REJECTION_CASES
 
 
-def get_cases_by_complexity(complexity: Complexity) -> list[WriteTestCase]:
+# Lookup indexes, built once at import
+_CASES_BY_ID: dict[str, WriteTestCase] = {tc.id: tc for tc in ALL_WRITE_CASES}
+_CASES_BY_COMPLEXITY: dict[Complexity, tuple[WriteTestCase, ...]] = {
+    c: tuple(tc for tc in ALL_WRITE_CASES if tc.complexity is c) for c in Complexity
+}
+_CASES_BY_TASK_TYPE: dict[TaskType, tuple[WriteTestCase, ...]] = {
+    t: tuple(tc for tc in ALL_WRITE_CASES if tc.task_type is t) for t in TaskType
+}
+
+
+def get_cases_by_complexity(complexity: Complexity) -> tuple[WriteTestCase, ...]:
     """Get all test cases of a specific complexity."""
-    return [tc for tc in ALL_WRITE_CASES if tc.complexity == complexity]
+    return _CASES_BY_COMPLEXITY.get(complexity, ())
 
 
-def get_cases_by_task_type(task_type: TaskType) -> list[WriteTestCase]:
+def get_cases_by_task_type(task_type: TaskType) -> tuple[WriteTestCase, ...]:
     """Get all test cases of a specific task type."""
-    return [tc for tc in ALL_WRITE_CASES if tc.task_type == task_type]
+    return _CASES_BY_TASK_TYPE.get(task_type, ())
 
 
 def get_case_by_id(case_id: str) -> Optional[WriteTestCase]:
     """Get a specific test case by ID."""
-    for tc in ALL_WRITE_CASES:
-        if tc.id == case_id:
-            return tc
-    return None
+    return _CASES_BY_ID.get(case_id)
@@ -5,32 +5,145 @@ Worldview Format Specification Generator
 Generates documentation and code from canonical definitions.
 
 Usage:
-    python generate.py [command]
+    python generate.py [-q|--quiet] [command]
 
 Commands:
     all         - Generate all outputs (default)
     rust        - Generate Rust constants for validator
-    system      - Generate condensed system prompt
+    system      - Generate condensed system prompt (system.md, embedded in the CLI at build time)
     markdown    - Generate markdown tables
     readme      - Update README.md with generated content
+
+Generated files are only rewritten when their contents change; -q/--quiet
+omits the report line for files that were left unchanged.
 """
 
+import json
+import os
 import sys
-import re
-import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import List
 
 SPEC_DIR = Path(__file__).parent
 ROOT_DIR = SPEC_DIR.parent
 TOKENS_FILE = SPEC_DIR / "tokens.yaml"
 GRAMMAR_FILE = SPEC_DIR / "grammar.pest"
+TOKENS_CACHE = SPEC_DIR / "tokens.yaml.json"
+RUST_OUTPUT = ROOT_DIR / "validator" / "src" / "tokens_generated.rs"
+SYSTEM_OUTPUT = ROOT_DIR / "system.md"
+README_PATH = ROOT_DIR / "README.md"
 
 
 def load_tokens() -> dict:
-    """Load the canonical token definitions."""
-    with open(TOKENS_FILE) as f:
-        return yaml.safe_load(f)
+    """
+    Load the canonical token definitions.
+
+    Parsed results are memoized per (mtime, size) of tokens.yaml, so repeated
+    calls in one process are free until the file changes. The parsed result
+    is also kept in a JSON sidecar (tokens.yaml.json) that records the YAML's
+    mtime and size, so later runs skip the YAML parse.
+    """
+    stat = TOKENS_FILE.stat()
+    return _load_tokens_for(stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1)
+def _load_tokens_for(src_mtime: int, src_size: int) -> dict:
+    """Load tokens.yaml as of the given stat; the arguments key the cache."""
+    try:
+        cached = json.loads(TOKENS_CACHE.read_bytes())
+        if cached["mtime_ns"] == src_mtime and cached["size"] == src_size:
+            return cached["tokens"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    # PyYAML is only imported when the sidecar is stale
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    tokens = yaml.load(TOKENS_FILE.read_bytes(), Loader=SafeLoader)
+    try:
+        TOKENS_CACHE.write_text(json.dumps({
+            "mtime_ns": src_mtime,
+            "size": src_size,
+            "tokens": tokens,
+        }))
+    except OSError:
+        pass
+    return tokens
+
+
+def brief_symbols_by_length(tokens: dict) -> tuple[str, ...]:
+    """Get brief form symbols ordered longest first, for greedy matching."""
+    return _sorted_by_length(tuple(bf["symbol"] for bf in tokens["brief_forms"]))
+
+
+@lru_cache(maxsize=None)
+def _sorted_by_length(symbols: tuple[str, ...]) -> tuple[str, ...]:
+    """Sort symbols by length descending, computed once per symbol set."""
+    return tuple(sorted(symbols, key=len, reverse=True))
+
+
+# =============================================================================
+# SHARED DOCUMENTATION BLOCKS
+# =============================================================================
+
+_GRAMMAR_EBNF = """\
+```ebnf
+document    = concept+ ;
+concept     = concept_name NEWLINE facet+ ;
+facet       = INDENT(2) '.' facet_name NEWLINE claim+ ;
+claim       = INDENT(4) '-' claim_body [condition*] [source*] [reference*] ;
+
+condition   = '|' text ;
+source      = '@' identifier ;
+reference   = '&' concept_name ['.' facet_name] ;
+```"""
+
+_FACET_CLAIM_STRUCTURE = """\
+  .facet          (2-space indent, dot prefix)
+    - claim       (4-space indent, dash prefix)"""
+
+_SPEC_STRUCTURE_EXAMPLE = f"""\
+```
+Concept           (unindented, bare text)
+{_FACET_CLAIM_STRUCTURE}
+```"""
+
+_PROMPT_STRUCTURE_EXAMPLE = f"""\
+```
+Concept           (unindented)
+{_FACET_CLAIM_STRUCTURE}
+```"""
+
+_SPEC_CLAIM_ORDER_EXAMPLE = """\
+```
+- claim_text | condition @source &reference
+```"""
+
+_PROMPT_CLAIM_ORDER_EXAMPLE = """\
+```
+- claim | condition @source &reference
+```"""
+
+_TRUST_EXAMPLE = """\
+```
+Trust
+  .formation
+    - slow
+    - requires consistency | over time
+  .erosion
+    - fast !
+    - asymmetric vs formation &Trust.formation
+```"""
+
+
+def _symbol_rows(entries) -> str:
+    """Format `| symbol | meaning | example |` rows for brief forms or modifiers."""
+    return "\n".join(map("| `{symbol}` | {meaning} | `{example}` |".format_map, entries))
 
 
 # =============================================================================
@@ -39,152 +152,150 @@ def load_tokens() -> dict:
 
 def generate_language_spec(tokens: dict) -> str:
     """Generate a language specification section following standard documentation conventions."""
-    output = []
-
-    output.append("## Language Specification\n")
-
-    # Grammar (EBNF-style)
-    output.append("### Grammar\n")
-    output.append("```ebnf")
-    output.append("document    = concept+ ;")
-    output.append("concept     = concept_name NEWLINE facet+ ;")
-    output.append("facet       = INDENT(2) '.' facet_name NEWLINE claim+ ;")
-    output.append("claim       = INDENT(4) '-' claim_body [condition*] [source*] [reference*] ;")
-    output.append("")
-    output.append("condition   = '|' text ;")
-    output.append("source      = '@' identifier ;")
-    output.append("reference   = '&' concept_name ['.' facet_name] ;")
-    output.append("```\n")
-
-    # Structure
-    output.append("### Structure\n")
-    output.append("```")
-    output.append("Concept           (unindented, bare text)")
-    output.append("  .facet          (2-space indent, dot prefix)")
-    output.append("    - claim       (4-space indent, dash prefix)")
-    output.append("```\n")
-
-    # Inline elements
-    output.append("### Inline Elements\n")
-    output.append("| Symbol | Name | Description |")
-    output.append("|--------|------|-------------|")
-    for elem in tokens["inline_elements"]:
-        output.append(f"| `{elem['symbol']}` | {elem['name']} | {elem['meaning']} |")
-    output.append("")
-
-    # Brief forms
-    output.append("### Brief Forms\n")
-    output.append("Minimal operators for common relationships (less common relationships use natural language):\n")
-    output.append("| Symbol | Meaning | Example |")
-    output.append("|--------|---------|---------|")
-    for bf in tokens["brief_forms"]:
-        output.append(f"| `{bf['symbol']}` | {bf['meaning']} | `{bf['example']}` |")
-    output.append("")
-
-    # Modifiers
-    output.append("### Modifiers\n")
-    output.append("Suffix markers that inflect claim meaning:\n")
-    output.append("| Symbol | Meaning | Example |")
-    output.append("|--------|---------|---------|")
-    for mod in tokens["modifiers"]:
-        output.append(f"| `{mod['symbol']}` | {mod['meaning']} | `{mod['example']}` |")
-    output.append("")
-
-    # Evolution
-    output.append("### Evolution\n")
+    inline_rows = "\n".join(
+        map("| `{symbol}` | {name} | {meaning} |".format_map, tokens["inline_elements"])
+    )
     evo = tokens["evolution"]["supersession"]
-    output.append(f"Supersession marker `{evo['syntax']}` indicates a belief that replaces a prior one:\n")
-    output.append("```")
-    output.append(evo['example'])
-    output.append("```\n")
 
-    # Claim order
-    output.append("### Claim Syntax\n")
-    output.append("Claims follow positional grammar—position implies role:\n")
-    output.append("```")
-    output.append("- claim_text | condition @source &reference")
-    output.append("```")
-    output.append("")
+    return f"""\
+## Language Specification
+
+### Grammar
+
+{_GRAMMAR_EBNF}
+
+### Structure
+
+{_SPEC_STRUCTURE_EXAMPLE}
+
+### Inline Elements
+
+| Symbol | Name | Description |
+|--------|------|-------------|
+{inline_rows}
+
+### Brief Forms
+
+Minimal operators for common relationships (less common relationships use natural language):
+
+| Symbol | Meaning | Example |
+|--------|---------|---------|
+{_symbol_rows(tokens["brief_forms"])}
+
+### Modifiers
 
-    return "\n".join(output)
+Suffix markers that inflect claim meaning:
+
+| Symbol | Meaning | Example |
+|--------|---------|---------|
+{_symbol_rows(tokens["modifiers"])}
+
+### Evolution
+
+Supersession marker `{evo['syntax']}` indicates a belief that replaces a prior one:
+
+```
+{evo['example']}
+```
+
+### Claim Syntax
+
+Claims follow positional grammar—position implies role:
+
+{_SPEC_CLAIM_ORDER_EXAMPLE}
+"""
 
 
 # =============================================================================
 # RUST GENERATION (for build.rs)
 # =============================================================================
 
-def generate_rust_constants(tokens: dict) -> str:
-    """Generate Rust constants for the validator."""
-    output = []
-    output.append("// Auto-generated from spec/tokens.yaml")
-    output.append("// Do not edit manually - regenerated at build time")
-    output.append("")
-
-    # Brief forms
-    output.append("/// Brief form operators defined in the Worldview spec")
-    output.append("pub const BRIEF_FORMS: &[(&str, &str)] = &[")
-    for bf in tokens["brief_forms"]:
-        output.append(f'    ("{bf["symbol"]}", "{bf["meaning"]}"),')
-    output.append("];")
-    output.append("")
-
-    # Modifiers
-    output.append("/// Modifier symbols defined in the Worldview spec")
-    output.append("pub const MODIFIERS: &[(&str, &str)] = &[")
-    for mod in tokens["modifiers"]:
-        output.append(f'    ("{mod["symbol"]}", "{mod["meaning"]}"),')
-    output.append("];")
-    output.append("")
-
-    # Brief form symbols only (for quick lookup)
-    output.append("/// Brief form operator symbols (ordered by length for matching)")
-    output.append("pub const BRIEF_FORM_SYMBOLS: &[&str] = &[")
-    # Sort by length descending for proper matching
-    symbols = sorted([bf["symbol"] for bf in tokens["brief_forms"]], key=len, reverse=True)
-    for sym in symbols:
-        output.append(f'    "{sym}",')
-    output.append("];")
-    output.append("")
-
-    # Modifier symbols only
-    output.append("/// Modifier symbols")
-    output.append("pub const MODIFIER_SYMBOLS: &[char] = &[")
-    for mod in tokens["modifiers"]:
-        output.append(f"    '{mod['symbol']}',")
-    output.append("];")
-    output.append("")
-
-    # Inline element symbols
-    output.append("/// Inline element symbols")
-    output.append("pub const CONDITION_SYMBOL: char = '|';")
-    output.append("pub const SOURCE_SYMBOL: char = '@';")
-    output.append("pub const REFERENCE_SYMBOL: char = '&';")
-    output.append("")
-
-    # Indentation levels
-    output.append("/// Indentation levels (in spaces)")
-    output.append("pub const CONCEPT_INDENT: usize = 0;")
-    output.append("pub const FACET_INDENT: usize = 2;")
-    output.append("pub const CLAIM_INDENT: usize = 4;")
-    output.append("")
-
-    # Prefixes
-    output.append("/// Element prefixes")
-    output.append("pub const FACET_PREFIX: char = '.';")
-    output.append("pub const CLAIM_PREFIX: char = '-';")
-
-    return "\n".join(output)
+_RUST_TEMPLATE = """\
+// Auto-generated from spec/tokens.yaml
+// Do not edit manually - regenerated at build time
 
+/// Brief form operators defined in the Worldview spec
+pub const BRIEF_FORMS: &[(&str, &str)] = &[
+{brief_rows}];
 
-def generate_build_rs() -> str:
-    """Generate build.rs for the validator."""
-    return '''//! Build script for worldview-validator
+/// Modifier symbols defined in the Worldview spec
+pub const MODIFIERS: &[(&str, &str)] = &[
+{modifier_rows}];
+
+/// Brief form operator symbols (ordered by length for matching)
+pub const BRIEF_FORM_SYMBOLS: &[&str] = &[
+{brief_symbol_rows}];
+
+/// Modifier symbols
+pub const MODIFIER_SYMBOLS: &[char] = &[
+{modifier_symbol_rows}];
+
+/// Inline element symbols
+pub const CONDITION_SYMBOL: char = '|';
+pub const SOURCE_SYMBOL: char = '@';
+pub const REFERENCE_SYMBOL: char = '&';
+
+/// Indentation levels (in spaces)
+pub const CONCEPT_INDENT: usize = 0;
+pub const FACET_INDENT: usize = 2;
+pub const CLAIM_INDENT: usize = 4;
+
+/// Element prefixes
+pub const FACET_PREFIX: char = '.';
+pub const CLAIM_PREFIX: char = '-';"""
+
+
+# Backslash-escapes for text interpolated into Rust string and char literals
+_RUST_ESC = str.maketrans({"\\": "\\\\", '"': '\\"', "'": "\\'"})
+
+
+def _rust_array_rows(items) -> str:
+    """Format Rust array elements one per line, each with a trailing comma."""
+    return "".join(f"    {item},\n" for item in items)
+
+
+def generate_rust_constants(tokens: dict) -> str:
+    """Generate Rust constants for the validator."""
+    brief = [
+        (bf["symbol"].translate(_RUST_ESC), bf["meaning"].translate(_RUST_ESC))
+        for bf in tokens["brief_forms"]
+    ]
+    mods = [
+        (mod["symbol"].translate(_RUST_ESC), mod["meaning"].translate(_RUST_ESC))
+        for mod in tokens["modifiers"]
+    ]
+    return _RUST_TEMPLATE.format(
+        brief_rows=_rust_array_rows(f'("{sym}", "{meaning}")' for sym, meaning in brief),
+        modifier_rows=_rust_array_rows(f'("{sym}", "{meaning}")' for sym, meaning in mods),
+        brief_symbol_rows=_rust_array_rows(
+            f'"{sym.translate(_RUST_ESC)}"' for sym in brief_symbols_by_length(tokens)
+        ),
+        modifier_symbol_rows=_rust_array_rows(f"'{sym}'" for sym, _ in mods),
+    )
+
+
+# Build script for the validator; a fixed string, so built once at import
+_BUILD_RS = '''//! Build script for worldview-validator
 //! Generates token definitions from spec/tokens.yaml at compile time.
 
+use serde::Deserialize;
 use std::env;
+use std::fmt::Write;
 use std::fs;
 use std::path::Path;
 
+#[derive(Deserialize)]
+struct TokenSpec {
+    brief_forms: Vec<Token>,
+    modifiers: Vec<Token>,
+}
+
+#[derive(Deserialize)]
+struct Token {
+    symbol: String,
+    meaning: String,
+}
+
 fn main() {
     let out_dir = env::var("OUT_DIR").unwrap();
     let dest_path = Path::new(&out_dir).join("tokens.rs");
@@ -197,172 +308,119 @@ fn main() {
 
     let tokens_yaml = fs::read_to_string(&tokens_path)
         .expect("Failed to read spec/tokens.yaml");
+    let spec: TokenSpec = serde_yaml::from_str(&tokens_yaml)
+        .expect("Failed to parse spec/tokens.yaml");
 
-    // Parse YAML manually (avoiding serde dependency in build script)
-    let rust_code = generate_tokens_rs(&tokens_yaml);
-
-    fs::write(&dest_path, rust_code).unwrap();
+    fs::write(&dest_path, generate_tokens_rs(&spec)).unwrap();
 }
 
-fn generate_tokens_rs(yaml: &str) -> String {
-    let mut output = String::from("// Auto-generated from spec/tokens.yaml\\n\\n");
-
-    // Parse brief_forms
-    let mut brief_forms = Vec::new();
-    let mut in_brief_forms = false;
-    let mut current_symbol = String::new();
-    let mut current_meaning = String::new();
-
-    for line in yaml.lines() {
-        let trimmed = line.trim();
+fn generate_tokens_rs(spec: &TokenSpec) -> String {
+    let mut output = String::with_capacity(4096);
+    output.push_str("// Auto-generated from spec/tokens.yaml\\n\\n");
 
-        if trimmed == "brief_forms:" {
-            in_brief_forms = true;
-            continue;
-        }
-
-        if in_brief_forms {
-            if trimmed.starts_with("- symbol:") {
-                if !current_symbol.is_empty() {
-                    brief_forms.push((current_symbol.clone(), current_meaning.clone()));
-                }
-                current_symbol = trimmed.trim_start_matches("- symbol:").trim().trim_matches(\'"\').to_string();
-                current_meaning.clear();
-            } else if trimmed.starts_with("meaning:") {
-                current_meaning = trimmed.trim_start_matches("meaning:").trim().trim_matches(\'"\').to_string();
-            } else if trimmed.starts_with("modifiers:") {
-                if !current_symbol.is_empty() {
-                    brief_forms.push((current_symbol.clone(), current_meaning.clone()));
-                }
-                break;
-            }
-        }
-    }
-
-    // Generate BRIEF_FORMS
+    // Generate BRIEF_FORMS ({:?} renders escaped Rust literals)
     output.push_str("pub const BRIEF_FORMS: &[(&str, &str)] = &[\\n");
-    for (sym, meaning) in &brief_forms {
-        output.push_str(&format!("    (\\"{sym}\\", \\"{meaning}\\"),\\n"));
+    for bf in &spec.brief_forms {
+        writeln!(output, "    ({:?}, {:?}),", bf.symbol, bf.meaning).unwrap();
     }
     output.push_str("];\\n\\n");
 
-    // Parse modifiers
-    let mut modifiers = Vec::new();
-    let mut in_modifiers = false;
-    current_symbol.clear();
-    current_meaning.clear();
-
-    for line in yaml.lines() {
-        let trimmed = line.trim();
-
-        if trimmed == "modifiers:" {
-            in_modifiers = true;
-            continue;
-        }
-
-        if in_modifiers {
-            if trimmed.starts_with("- symbol:") {
-                if !current_symbol.is_empty() {
-                    modifiers.push((current_symbol.clone(), current_meaning.clone()));
-                }
-                current_symbol = trimmed.trim_start_matches("- symbol:").trim().trim_matches(\'"\').to_string();
-                current_meaning.clear();
-            } else if trimmed.starts_with("meaning:") {
-                current_meaning = trimmed.trim_start_matches("meaning:").trim().trim_matches(\'"\').to_string();
-            } else if trimmed.starts_with("evolution:") || trimmed.starts_with("claim_order:") {
-                if !current_symbol.is_empty() {
-                    modifiers.push((current_symbol.clone(), current_meaning.clone()));
-                }
-                break;
-            }
-        }
-    }
-
     // Generate MODIFIERS
     output.push_str("pub const MODIFIERS: &[(&str, &str)] = &[\\n");
-    for (sym, meaning) in &modifiers {
-        output.push_str(&format!("    (\\"{sym}\\", \\"{meaning}\\"),\\n"));
+    for m in &spec.modifiers {
+        writeln!(output, "    ({:?}, {:?}),", m.symbol, m.meaning).unwrap();
     }
     output.push_str("];\\n\\n");
 
-    // Generate symbol-only arrays
+    // Generate symbol-only arrays, brief forms longest first (stable sort)
+    let mut symbols: Vec<&str> = spec.brief_forms.iter().map(|bf| bf.symbol.as_str()).collect();
+    symbols.sort_by(|a, b| b.len().cmp(&a.len()));
     output.push_str("pub const BRIEF_FORM_SYMBOLS: &[&str] = &[\\n");
-    let mut symbols: Vec<_> = brief_forms.iter().map(|(s, _)| s.clone()).collect();
-    symbols.sort_by(|a, b| b.len().cmp(&a.len())); // Sort by length descending
     for sym in &symbols {
-        output.push_str(&format!("    \\"{sym}\\",\\n"));
+        writeln!(output, "    {sym:?},").unwrap();
     }
     output.push_str("];\\n\\n");
 
     output.push_str("pub const MODIFIER_SYMBOLS: &[char] = &[\\n");
-    for (sym, _) in &modifiers {
-        if sym.len() == 1 {
-            output.push_str(&format!("    \\'{}\\',\\n", sym.chars().next().unwrap()));
+    for m in &spec.modifiers {
+        if m.symbol.len() == 1 {
+            writeln!(output, "    {:?},", m.symbol.chars().next().unwrap()).unwrap();
         }
     }
     output.push_str("];\\n\\n");
 
     // Static constants
-    output.push_str("pub const CONDITION_SYMBOL: char = \\'|\\';\\n");
-    output.push_str("pub const SOURCE_SYMBOL: char = \\'@\\';\\n");
-    output.push_str("pub const REFERENCE_SYMBOL: char = \\'&\\';\\n");
-    output.push_str("pub const CONCEPT_INDENT: usize = 0;\\n");
-    output.push_str("pub const FACET_INDENT: usize = 2;\\n");
-    output.push_str("pub const CLAIM_INDENT: usize = 4;\\n");
-    output.push_str("pub const FACET_PREFIX: char = \\'.\\';\\n");
-    output.push_str("pub const CLAIM_PREFIX: char = \\'-\\';\\n");
+    output.push_str(concat!(
+        "pub const CONDITION_SYMBOL: char = '|';\\n",
+        "pub const SOURCE_SYMBOL: char = '@';\\n",
+        "pub const REFERENCE_SYMBOL: char = '&';\\n",
+        "pub const CONCEPT_INDENT: usize = 0;\\n",
+        "pub const FACET_INDENT: usize = 2;\\n",
+        "pub const CLAIM_INDENT: usize = 4;\\n",
+        "pub const FACET_PREFIX: char = '.';\\n",
+        "pub const CLAIM_PREFIX: char = '-';\\n",
+    ));
 
     output
 }
 '''
 
 
+def generate_build_rs() -> str:
+    """Generate build.rs for the validator."""
+    return _BUILD_RS
+
+
 # =============================================================================
 # MARKDOWN GENERATION
 # =============================================================================
 
 def generate_markdown_tables(tokens: dict) -> str:
     """Generate markdown tables for SPEC.md."""
-    output = []
-
-    # Structure table
-    output.append("### Hierarchy\n")
-    output.append("| Element | Notation | Indentation |")
-    output.append("|---------|----------|-------------|")
-    for name, info in tokens["structure"].items():
-        prefix = f"`{info['prefix']}`" if info["prefix"] else "Bare text"
-        indent = f"{info['indent']} spaces" if info["indent"] > 0 else "None (column 0)"
-        output.append(f"| {name.title()} | {prefix} | {indent} |")
-    output.append("")
-
-    # Inline elements table
-    output.append("### Inline Elements\n")
-    output.append("| Element | Symbol | Position |")
-    output.append("|---------|--------|----------|")
-    for elem in tokens["inline_elements"]:
-        symbol = f"`{elem['symbol']}`"
-        output.append(f"| {elem['name'].title()} | {symbol} | {elem['position'].title()} |")
-    output.append("")
-
-    # Brief forms table
-    output.append("## Brief Forms\n")
-    output.append("Minimal operators for common relationships (less common relationships use natural language):\n")
-    output.append("| Symbol | Meaning | Example |")
-    output.append("|--------|---------|---------|")
-    for bf in tokens["brief_forms"]:
-        output.append(f"| `{bf['symbol']}` | {bf['meaning']} | `{bf['example']}` |")
-    output.append("")
-
-    # Modifiers table
-    output.append("## Modifiers\n")
-    output.append("Suffix markers inflect claim meaning:\n")
-    output.append("| Modifier | Meaning | Example |")
-    output.append("|----------|---------|---------|")
-    for mod in tokens["modifiers"]:
-        output.append(f"| `{mod['symbol']}` | {mod['meaning']} | `{mod['example']}` |")
-    output.append("")
-
-    return "\n".join(output)
+    hierarchy_rows = "\n".join(
+        "| {} | {} | {} |".format(
+            name.title(),
+            f"`{info['prefix']}`" if info["prefix"] else "Bare text",
+            f"{info['indent']} spaces" if info["indent"] > 0 else "None (column 0)",
+        )
+        for name, info in tokens["structure"].items()
+    )
+    inline_rows = "\n".join(
+        f"| {elem['name'].title()} | `{elem['symbol']}` | {elem['position'].title()} |"
+        for elem in tokens["inline_elements"]
+    )
+    brief_rows = _symbol_rows(tokens["brief_forms"])
+    modifier_rows = _symbol_rows(tokens["modifiers"])
+
+    return f"""\
+### Hierarchy
+
+| Element | Notation | Indentation |
+|---------|----------|-------------|
+{hierarchy_rows}
+
+### Inline Elements
+
+| Element | Symbol | Position |
+|---------|--------|----------|
+{inline_rows}
+
+## Brief Forms
+
+Minimal operators for common relationships (less common relationships use natural language):
+
+| Symbol | Meaning | Example |
+|--------|---------|---------|
+{brief_rows}
+
+## Modifiers
+
+Suffix markers inflect claim meaning:
+
+| Modifier | Meaning | Example |
+|----------|---------|---------|
+{modifier_rows}
+"""
 
 
 # =============================================================================
@@ -371,132 +429,114 @@ def generate_markdown_tables(tokens: dict) -> str:
 
 def generate_system_prompt(tokens: dict) -> str:
     """Generate a condensed system prompt for LLM context."""
-    output = []
-
-    output.append("# Worldview System Prompt")
-    output.append("")
-    output.append("You maintain a Worldview format document—a compact notation encoding beliefs, stances, and understanding. The entire document is always in context; you update it autonomously as you learn.")
-    output.append("")
-
-    # Structure
-    output.append("## Structure")
-    output.append("")
-    output.append("```")
-    output.append("Concept           (unindented)")
-    output.append("  .facet          (2-space indent, dot prefix)")
-    output.append("    - claim       (4-space indent, dash prefix)")
-    output.append("```")
-    output.append("")
-    output.append("Every concept has facets. Every facet has claims. Claims may include conditions, sources, and references.")
-    output.append("")
-
-    # Notation table
-    output.append("## Notation")
-    output.append("")
-    output.append("| Symbol | Meaning | Example |")
-    output.append("|--------|---------|---------|")
-
-    # Inline elements
-    for elem in tokens["inline_elements"]:
-        output.append(f"| `{elem['symbol']}` | {elem['name']} ({elem['meaning']}) | `{elem['example']}` |")
-
-    # Brief forms
-    for bf in tokens["brief_forms"]:
-        output.append(f"| `{bf['symbol']}` | {bf['meaning']} | `{bf['example']}` |")
-
-    # Modifiers
-    for mod in tokens["modifiers"]:
-        output.append(f"| `{mod['symbol']}` | {mod['meaning']} | `{mod['example']}` |")
-
-    # Evolution
     evo = tokens["evolution"]["supersession"]
-    output.append(f"| `[<= prior]` | supersedes | `{evo['example'].split('- ')[1]}` |")
-    output.append("")
-
-    # Claim order
-    output.append("## Claim Order")
-    output.append("")
-    output.append("```")
-    output.append("- claim | condition @source &reference")
-    output.append("```")
-    output.append("")
-    output.append("Position implies role. No labels needed.")
-    output.append("")
-
-    # Maintenance rules
-    output.append("## Maintenance Rules")
-    output.append("")
-    output.append("- **Add** new concepts, facets, or claims as understanding develops")
-    output.append("- **Update** claims by replacing or adding supersession markers")
-    output.append("- **Reference** related concepts with `&` rather than duplicating")
-    output.append("- **Preserve** density—no prose, articles, or filler")
-    output.append("- **Tolerate** contradiction—conflicting claims may coexist")
-    output.append("")
-
-    # What's stored vs derived
-    output.append("## What's Stored vs Derived")
-    output.append("")
-    output.append("**Stored:** Claims, conditions, sources, references, structure")
-    output.append("")
-    output.append("**Derived at runtime:** Confidence (from sources/conditions), predictions, evaluations, identity")
-    output.append("")
-
-    # Example
-    output.append("## Example")
-    output.append("")
-    output.append("```")
-    output.append("Trust")
-    output.append("  .formation")
-    output.append("    - slow")
-    output.append("    - requires consistency | over time")
-    output.append("  .erosion")
-    output.append("    - fast !")
-    output.append("    - asymmetric vs formation &Trust.formation")
-    output.append("```")
-    output.append("")
-    output.append("When you encounter information that refines understanding, update the Worldview document. Carry this worldview forward into all reasoning.")
-    output.append("")
-
-    return "\n".join(output)
+    # Inline elements, brief forms, modifiers, then evolution
+    notation_rows = "\n".join([
+        *(
+            "| `{symbol}` | {name} ({meaning}) | `{example}` |".format_map(elem)
+            for elem in tokens["inline_elements"]
+        ),
+        _symbol_rows(tokens["brief_forms"]),
+        _symbol_rows(tokens["modifiers"]),
+        f"| `[<= prior]` | supersedes | `{evo['example'].split('- ')[1]}` |",
+    ])
+
+    return f"""\
+# Worldview System Prompt
+
+You maintain a Worldview format document—a compact notation encoding beliefs, stances, and understanding. The entire document is always in context; you update it autonomously as you learn.
+
+## Structure
+
+{_PROMPT_STRUCTURE_EXAMPLE}
+
+Every concept has facets. Every facet has claims. Claims may include conditions, sources, and references.
+
+## Notation
+
+| Symbol | Meaning | Example |
+|--------|---------|---------|
+{notation_rows}
+
+## Claim Order
+
+{_PROMPT_CLAIM_ORDER_EXAMPLE}
+
+Position implies role. No labels needed.
+
+## Maintenance Rules
+
+- **Add** new concepts, facets, or claims as understanding develops
+- **Update** claims by replacing or adding supersession markers
+- **Reference** related concepts with `&` rather than duplicating
+- **Preserve** density—no prose, articles, or filler
+- **Tolerate** contradiction—conflicting claims may coexist
+
+## What's Stored vs Derived
+
+**Stored:** Claims, conditions, sources, references, structure
+
+**Derived at runtime:** Confidence (from sources/conditions), predictions, evaluations, identity
+
+## Example
+
+{_TRUST_EXAMPLE}
+
+When you encounter information that refines understanding, update the Worldview document. Carry this worldview forward into all reasoning.
+"""
 
 
 # =============================================================================
 # README UPDATE
 # =============================================================================
 
+# Old diagram markers, replaced by the spec section when found
+_OLD_START_MARKER = "<!-- BEGIN GENERATED SYNTAX DIAGRAMS -->"
+_OLD_END_MARKER = "<!-- END GENERATED SYNTAX DIAGRAMS -->"
+
+# Current spec section markers
+_SPEC_START_MARKER = "<!-- BEGIN GENERATED LANGUAGE SPEC -->"
+_SPEC_END_MARKER = "<!-- END GENERATED LANGUAGE SPEC -->"
+
+
+def _splice_section(content: str, start_marker: str, end_marker: str, new_section: str) -> str:
+    """Replace the first start_marker...end_marker span with new_section."""
+    start = content.find(start_marker)
+    if start < 0:
+        return content
+    end = content.find(end_marker, start + len(start_marker))
+    if end < 0:
+        return content
+    return content[:start] + new_section + content[end + len(end_marker):]
+
+
 def update_readme(tokens: dict) -> str:
     """Update README.md with generated language specification section."""
-    readme_path = ROOT_DIR / "README.md"
-    readme_content = readme_path.read_text()
+    readme_content = README_PATH.read_text()
 
     # Generate the language specification section
     spec_section = generate_language_spec(tokens)
 
-    # Check for old diagram markers first and replace them
-    old_start_marker = "<!-- BEGIN GENERATED SYNTAX DIAGRAMS -->"
-    old_end_marker = "<!-- END GENERATED SYNTAX DIAGRAMS -->"
-
-    # New markers
-    start_marker = "<!-- BEGIN GENERATED LANGUAGE SPEC -->"
-    end_marker = "<!-- END GENERATED LANGUAGE SPEC -->"
+    new_section = f"{_SPEC_START_MARKER}\n{spec_section}\n{_SPEC_END_MARKER}"
 
-    new_section = f"{start_marker}\n{spec_section}\n{end_marker}"
-
-    if old_start_marker in readme_content:
+    if _OLD_START_MARKER in readme_content:
         # Replace old diagram section with new spec section
-        pattern = f"{re.escape(old_start_marker)}.*?{re.escape(old_end_marker)}"
-        readme_content = re.sub(pattern, new_section, readme_content, flags=re.DOTALL)
-    elif start_marker in readme_content:
+        readme_content = _splice_section(
+            readme_content, _OLD_START_MARKER, _OLD_END_MARKER, new_section
+        )
+    elif _SPEC_START_MARKER in readme_content:
         # Replace existing spec section
-        pattern = f"{re.escape(start_marker)}.*?{re.escape(end_marker)}"
-        readme_content = re.sub(pattern, new_section, readme_content, flags=re.DOTALL)
+        readme_content = _splice_section(
+            readme_content, _SPEC_START_MARKER, _SPEC_END_MARKER, new_section
+        )
     else:
-        # Insert before "## Tools" section
-        tools_marker = "## Tools"
-        if tools_marker in readme_content:
-            readme_content = readme_content.replace(
-                tools_marker,
-                f"{new_section}\n\n{tools_marker}"
+        # Insert before the first "## Tools" section
+        tools_index = readme_content.find("## Tools")
+        if tools_index >= 0:
+            readme_content = (
+                readme_content[:tools_index]
+                + f"{new_section}\n\n"
+                + readme_content[tools_index:]
             )
         else:
             # Append to end
@@ -509,49 +549,99 @@ def update_readme(tokens: dict) -> str:
 # MAIN
 # =============================================================================
 
-def main():
-    command = sys.argv[1] if len(sys.argv) > 1 else "all"
-    tokens = load_tokens()
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Atomically replace path with data unless it already holds exactly that.
 
-    if command in ("markdown", "all"):
-        md = generate_markdown_tables(tokens)
-        print("=== MARKDOWN TABLES ===")
-        print(md)
-        if command == "all":
-            print()
+    Files whose contents are already up to date are left untouched so their
+    mtime does not invalidate downstream build caches.
 
-    if command in ("rust", "all"):
-        rust = generate_rust_constants(tokens)
-        print("=== RUST CONSTANTS ===")
-        print(rust)
-        # Write to file
-        rust_file = ROOT_DIR / "validator" / "src" / "tokens_generated.rs"
-        rust_file.write_text(rust + "\n")
-        print(f"\nWritten to: {rust_file}")
-        if command == "all":
-            print()
+    Returns:
+        True if the file was written
+    """
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def write_outputs(pending: list[tuple[Path, bytes]], quiet: bool = False) -> None:
+    """Write all generated outputs, reporting unchanged files unless quiet."""
+    for path, data in pending:
+        if write_if_changed(path, data):
+            print(f"Written to: {path}")
+        elif not quiet:
+            print(f"Unchanged: {path}")
+
+
+def _do_markdown(md: str, pending: list[tuple[Path, bytes]]) -> None:
+    print("=== MARKDOWN TABLES ===")
+    print(md)
 
-    if command in ("system", "all"):
-        system = generate_system_prompt(tokens)
-        print("=== SYSTEM PROMPT ===")
-        print(system)
-        # Write to file
-        system_file = ROOT_DIR / "system.md"
-        system_file.write_text(system)
-        print(f"\nWritten to: {system_file}")
-        if command == "all":
-            print()
 
-    if command in ("readme", "all"):
-        readme = update_readme(tokens)
-        readme_path = ROOT_DIR / "README.md"
-        readme_path.write_text(readme)
-        print(f"=== README UPDATED ===")
-        print(f"Written to: {readme_path}")
+def _do_rust(rust: str, pending: list[tuple[Path, bytes]]) -> None:
+    print("=== RUST CONSTANTS ===")
+    print(rust)
+    pending.append((RUST_OUTPUT, (rust + "\n").encode()))
+
+
+def _do_system(system: str, pending: list[tuple[Path, bytes]]) -> None:
+    print("=== SYSTEM PROMPT ===")
+    print(system)
+    pending.append((SYSTEM_OUTPUT, system.encode()))
+
+
+def _do_readme(readme: str, pending: list[tuple[Path, bytes]]) -> None:
+    # Nothing to show; write_outputs reports whether README.md was written
+    pending.append((README_PATH, readme.encode()))
+
+
+# Commands run by "all", in order: name -> (generator, output handler)
+COMMANDS = {
+    "markdown": (generate_markdown_tables, _do_markdown),
+    "rust": (generate_rust_constants, _do_rust),
+    "system": (generate_system_prompt, _do_system),
+    "readme": (update_readme, _do_readme),
+}
+
+def main():
+    args = sys.argv[1:]
+    quiet = "-q" in args or "--quiet" in args
+    args = [arg for arg in args if arg not in ("-q", "--quiet")]
+    command = args[0] if args else "all"
 
     if command == "build-rs":
         # Special command: generate build.rs content
         print(generate_build_rs())
+        return
+
+    if command == "all":
+        names = list(COMMANDS)
+    elif command in COMMANDS:
+        names = [command]
+    else:
+        print(f"Unknown command: {command}", file=sys.stderr)
+        print(__doc__, file=sys.stderr)
+        sys.exit(1)
+
+    tokens = load_tokens()
+    pending: list[tuple[Path, bytes]] = []
+    for i, name in enumerate(names):
+        if i:
+            print()
+        generator, handler = COMMANDS[name]
+        handler(generator(tokens), pending)
+
+    write_outputs(pending, quiet)
 
 
 if __name__ == "__main__":